@@ -1,15 +1,22 @@
 """Enhanced Z-Wave Thermostat integration for Home Assistant."""
 from __future__ import annotations
 
+from collections.abc import Awaitable, Callable
 import logging
 from typing import Any
 
+import voluptuous as vol
+
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import Platform
+from homeassistant.const import ATTR_ENTITY_ID, ENTITY_MATCH_ALL, Platform
 from homeassistant.core import HomeAssistant, ServiceCall
+import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.service import async_extract_referenced_entity_ids
 
 from .const import (
     DOMAIN,
+    CONF_SOURCE_ENTITY,
+    CONF_TRACKING_ENABLED,
     SERVICE_SET_SCHEDULE,
     SERVICE_CLEAR_SCHEDULE,
     SERVICE_COPY_SCHEDULE,
@@ -18,15 +25,23 @@ from .const import (
     SERVICE_EXPORT_USAGE,
 )
 from .coordinator import EnhancedThermostatCoordinator
+from .scheduler import ThermostatScheduler
 
 _LOGGER = logging.getLogger(__name__)
 
 PLATFORMS: list[Platform] = [Platform.CLIMATE, Platform.SENSOR]
 
+# Services target entities, devices or areas; targets are resolved on dispatch
+SERVICE_SCHEMA = cv.make_entity_service_schema({}, extra=vol.ALLOW_EXTRA)
+SET_OVERRIDE_SCHEMA = cv.make_entity_service_schema(
+    {vol.Required("until"): cv.datetime}, extra=vol.ALLOW_EXTRA
+)
+
 
 async def async_setup(hass: HomeAssistant, config: dict[str, Any]) -> bool:
     """Set up the Enhanced Thermostat component."""
-    hass.data.setdefault(DOMAIN, {})
+    hass.data.setdefault(DOMAIN, {"coordinators": {}, "_by_source": {}})
+    await async_register_services(hass)
     return True
 
 
@@ -35,12 +50,14 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     coordinator = EnhancedThermostatCoordinator(hass, entry)
     await coordinator.async_config_entry_first_refresh()
 
-    hass.data[DOMAIN][entry.entry_id] = coordinator
+    hass.data[DOMAIN]["coordinators"][entry.entry_id] = coordinator
+    hass.data[DOMAIN]["_by_source"][coordinator.source_entity_id] = coordinator
+    entry.async_on_unload(coordinator.async_track_source())
+    entry.async_on_unload(coordinator.service_coalescer.cancel_all)
+
+    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
-    
-    # Register services
-    await async_register_services(hass)
 
     return True
 
@@ -48,126 +65,155 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
-        hass.data[DOMAIN].pop(entry.entry_id)
+        coordinator = hass.data[DOMAIN]["coordinators"].pop(entry.entry_id)
+        hass.data[DOMAIN]["_by_source"].pop(coordinator.source_entity_id, None)
 
     return unload_ok
 
 
 async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
-    """Reload config entry."""
-    await async_unload_entry(hass, entry)
-    await async_setup_entry(hass, entry)
+    """Reload config entry, applying option-only changes in place."""
+    coordinator = hass.data[DOMAIN]["coordinators"][entry.entry_id]
+    coordinator.async_clear_config_cache()
+    if (
+        coordinator.source_entity_id == entry.data.get(CONF_SOURCE_ENTITY, "")
+        and coordinator.tracking_enabled
+        == coordinator.get_config_value(CONF_TRACKING_ENABLED, True)
+    ):
+        # Entities pick up the remaining options from their own update listeners
+        return
+
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
+def _format_export_notification(csv_data: str) -> str:
+    """Log exported usage data and return the notification body."""
+    _LOGGER.info("Usage data exported:\n%s", csv_data)
+    return f"```\n{csv_data}\n```"
+
+
+def _get_scheduler(
+    coordinator: EnhancedThermostatCoordinator,
+) -> ThermostatScheduler | None:
+    """Return the coordinator's scheduler, logging if the climate entity has none."""
+    if coordinator.scheduler is None:
+        _LOGGER.error(
+            "Schedule not available for %s: climate entity is not set up",
+            coordinator.source_entity_id,
+        )
+    return coordinator.scheduler
+
+
+async def _svc_set_schedule(
+    coordinator: EnhancedThermostatCoordinator, call: ServiceCall
+) -> None:
+    """Handle set_schedule service call."""
+    if scheduler := _get_scheduler(coordinator):
+        scheduler.set_schedule(call.data.get("day"), call.data.get("events"))
+        coordinator.async_update_listeners()
+
+
+async def _svc_clear_schedule(
+    coordinator: EnhancedThermostatCoordinator, call: ServiceCall
+) -> None:
+    """Handle clear_schedule service call."""
+    if scheduler := _get_scheduler(coordinator):
+        scheduler.clear_schedule(call.data.get("day"))
+        coordinator.async_update_listeners()
+
+
+async def _svc_copy_schedule(
+    coordinator: EnhancedThermostatCoordinator, call: ServiceCall
+) -> None:
+    """Handle copy_schedule service call."""
+    if scheduler := _get_scheduler(coordinator):
+        scheduler.copy_schedule(call.data.get("from_day"), call.data.get("to_day"))
+        coordinator.async_update_listeners()
+
+
+async def _svc_set_override(
+    coordinator: EnhancedThermostatCoordinator, call: ServiceCall
+) -> None:
+    """Handle set_override service call."""
+    coordinator.override_until = call.data["until"]
+    # Entities only write state when their cached attributes change
+    coordinator.async_update_listeners()
+
+
+async def _svc_clear_override(
+    coordinator: EnhancedThermostatCoordinator, call: ServiceCall
+) -> None:
+    """Handle clear_override service call."""
+    coordinator.override_until = None
+    coordinator.async_update_listeners()
+
+
+async def _svc_export_usage(
+    coordinator: EnhancedThermostatCoordinator, call: ServiceCall
+) -> None:
+    """Handle export_usage service call."""
+    usage_tracker = coordinator.usage_tracker
+    if usage_tracker:
+        # Large exports are logged and formatted off the event loop
+        message = await coordinator.hass.async_add_executor_job(
+            _format_export_notification, usage_tracker.export_csv()
+        )
+        
+        # Create a persistent notification with the CSV data
+        from homeassistant.components.persistent_notification import async_create
+        async_create(
+            coordinator.hass,
+            message,
+            title="Enhanced Thermostat Usage Export",
+            notification_id="enhanced_thermostat_export",
+        )
+
+
+_SVC_TABLE: dict[
+    str,
+    Callable[[EnhancedThermostatCoordinator, ServiceCall], Awaitable[None]],
+] = {
+    SERVICE_SET_SCHEDULE: _svc_set_schedule,
+    SERVICE_CLEAR_SCHEDULE: _svc_clear_schedule,
+    SERVICE_COPY_SCHEDULE: _svc_copy_schedule,
+    SERVICE_SET_OVERRIDE: _svc_set_override,
+    SERVICE_CLEAR_OVERRIDE: _svc_clear_override,
+    SERVICE_EXPORT_USAGE: _svc_export_usage,
+}
 
 
 async def async_register_services(hass: HomeAssistant) -> None:
     """Register services for the integration."""
     
-    async def handle_set_schedule(call: ServiceCall) -> None:
-        """Handle set_schedule service call."""
-        entity_id = call.data.get("entity_id")
-        day = call.data.get("day")
-        events = call.data.get("events")
-        
-        # Find the coordinator for this entity
-        for entry_id, coordinator in hass.data[DOMAIN].items():
-            if isinstance(coordinator, EnhancedThermostatCoordinator):
-                # Get the climate entity's scheduler
-                climate_entities = hass.states.async_entity_ids("climate")
-                if entity_id in climate_entities:
-                    from .scheduler import ThermostatScheduler
-                    scheduler = ThermostatScheduler(coordinator)
-                    scheduler.set_schedule(day, events)
-                    break
-    
-    async def handle_clear_schedule(call: ServiceCall) -> None:
-        """Handle clear_schedule service call."""
-        entity_id = call.data.get("entity_id")
-        day = call.data.get("day")
-        
-        for entry_id, coordinator in hass.data[DOMAIN].items():
-            if isinstance(coordinator, EnhancedThermostatCoordinator):
-                climate_entities = hass.states.async_entity_ids("climate")
-                if entity_id in climate_entities:
-                    from .scheduler import ThermostatScheduler
-                    scheduler = ThermostatScheduler(coordinator)
-                    scheduler.clear_schedule(day)
-                    break
-    
-    async def handle_copy_schedule(call: ServiceCall) -> None:
-        """Handle copy_schedule service call."""
-        entity_id = call.data.get("entity_id")
-        from_day = call.data.get("from_day")
-        to_day = call.data.get("to_day")
-        
-        for entry_id, coordinator in hass.data[DOMAIN].items():
-            if isinstance(coordinator, EnhancedThermostatCoordinator):
-                climate_entities = hass.states.async_entity_ids("climate")
-                if entity_id in climate_entities:
-                    from .scheduler import ThermostatScheduler
-                    scheduler = ThermostatScheduler(coordinator)
-                    scheduler.copy_schedule(from_day, to_day)
-                    break
-    
-    async def handle_set_override(call: ServiceCall) -> None:
-        """Handle set_override service call."""
-        entity_id = call.data.get("entity_id")
-        until = call.data.get("until")
-        
-        for entry_id, coordinator in hass.data[DOMAIN].items():
-            if isinstance(coordinator, EnhancedThermostatCoordinator):
-                climate_entities = hass.states.async_entity_ids("climate")
-                if entity_id in climate_entities:
-                    coordinator.override_until = until
-                    break
-    
-    async def handle_clear_override(call: ServiceCall) -> None:
-        """Handle clear_override service call."""
-        entity_id = call.data.get("entity_id")
-        
-        for entry_id, coordinator in hass.data[DOMAIN].items():
-            if isinstance(coordinator, EnhancedThermostatCoordinator):
-                climate_entities = hass.states.async_entity_ids("climate")
-                if entity_id in climate_entities:
-                    coordinator.override_until = None
-                    break
-    
-    async def handle_export_usage(call: ServiceCall) -> None:
-        """Handle export_usage service call."""
-        entity_id = call.data.get("entity_id")
-        days = call.data.get("days", 30)
-        
-        for entry_id, coordinator in hass.data[DOMAIN].items():
-            if isinstance(coordinator, EnhancedThermostatCoordinator):
-                usage_tracker = getattr(coordinator, "usage_tracker", None)
-                if usage_tracker:
-                    csv_data = usage_tracker.export_csv()
-                    _LOGGER.info("Usage data exported:\n%s", csv_data)
-                    
-                    # Create a persistent notification with the CSV data
-                    from homeassistant.components.persistent_notification import async_create
-                    async_create(
-                        hass,
-                        f"```\n{csv_data}\n```",
-                        title="Enhanced Thermostat Usage Export",
-                        notification_id="enhanced_thermostat_export",
-                    )
-                break
+    async def _dispatch(call: ServiceCall) -> None:
+        """Route a service call to the coordinators of the targeted entities."""
+        if call.data.get(ATTR_ENTITY_ID) == ENTITY_MATCH_ALL:
+            coordinators = list(hass.data[DOMAIN]["coordinators"].values())
+        else:
+            by_source = hass.data[DOMAIN]["_by_source"]
+            selected = async_extract_referenced_entity_ids(hass, call)
+            coordinators = []
+            for entity_id in selected.referenced | selected.indirectly_referenced:
+                coordinator = by_source.get(entity_id)
+                if coordinator is None:
+                    # Devices and areas may hold unrelated entities
+                    if entity_id in selected.referenced:
+                        _LOGGER.error(
+                            "No Enhanced Thermostat found for entity: %s", entity_id
+                        )
+                elif coordinator not in coordinators:
+                    # The source and enhanced entities share one coordinator
+                    coordinators.append(coordinator)
+
+        handler = _SVC_TABLE[call.service]
+        for coordinator in coordinators:
+            await handler(coordinator, call)
     
     # Register services
-    if not hass.services.has_service(DOMAIN, SERVICE_SET_SCHEDULE):
-        hass.services.async_register(DOMAIN, SERVICE_SET_SCHEDULE, handle_set_schedule)
-    
-    if not hass.services.has_service(DOMAIN, SERVICE_CLEAR_SCHEDULE):
-        hass.services.async_register(DOMAIN, SERVICE_CLEAR_SCHEDULE, handle_clear_schedule)
-    
-    if not hass.services.has_service(DOMAIN, SERVICE_COPY_SCHEDULE):
-        hass.services.async_register(DOMAIN, SERVICE_COPY_SCHEDULE, handle_copy_schedule)
-    
-    if not hass.services.has_service(DOMAIN, SERVICE_SET_OVERRIDE):
-        hass.services.async_register(DOMAIN, SERVICE_SET_OVERRIDE, handle_set_override)
-    
-    if not hass.services.has_service(DOMAIN, SERVICE_CLEAR_OVERRIDE):
-        hass.services.async_register(DOMAIN, SERVICE_CLEAR_OVERRIDE, handle_clear_override)
-    
-    if not hass.services.has_service(DOMAIN, SERVICE_EXPORT_USAGE):
-        hass.services.async_register(DOMAIN, SERVICE_EXPORT_USAGE, handle_export_usage)
+    for service in _SVC_TABLE:
+        hass.services.async_register(
+            DOMAIN,
+            service,
+            _dispatch,
+            schema=SET_OVERRIDE_SCHEMA if service == SERVICE_SET_OVERRIDE else SERVICE_SCHEMA,
+        )
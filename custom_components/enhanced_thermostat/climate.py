@@ -43,6 +43,11 @@ from .safety import SafetyMonitor
 
 _LOGGER = logging.getLogger(__name__)
 
+_DEFAULT_HVAC_MODES = (HVACMode.OFF, HVACMode.HEAT, HVACMode.COOL, HVACMode.HEAT_COOL)
+_HVAC_MODE_MAP = {mode.value: mode for mode in HVACMode}
+_HVAC_ACTION_MAP = {action.value: action for action in HVACAction}
+_SET_TEMPERATURE_KEYS = (ATTR_TEMPERATURE, "target_temp_high", "target_temp_low", "hvac_mode")
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -50,7 +55,7 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Enhanced Thermostat climate platform."""
-    coordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator = hass.data[DOMAIN]["coordinators"][entry.entry_id]
     
     async_add_entities(
         [EnhancedThermostatClimate(coordinator, entry)],
@@ -61,6 +66,20 @@ async def async_setup_entry(
 class EnhancedThermostatClimate(CoordinatorEntity, ClimateEntity):
     """Representation of an Enhanced Thermostat."""
 
+    # Only private fields are slotted; _attr_* stay in __dict__ for the HA bases
+    __slots__ = (
+        "_entry",
+        "_scheduler",
+        "_safety_monitor",
+        "_last_available",
+        "_cached_attrs",
+        "_cached_attrs_key",
+        "_cfg_safety_enabled",
+        "_cfg_schedule_enabled",
+        "_cfg_safety_min",
+        "_cfg_safety_max",
+    )
+
     _attr_has_entity_name = True
     _attr_name = None
     _attr_temperature_unit = UnitOfTemperature.CELSIUS
@@ -80,6 +99,17 @@ class EnhancedThermostatClimate(CoordinatorEntity, ClimateEntity):
         self._scheduler = ThermostatScheduler(coordinator)
         self._safety_monitor = SafetyMonitor(coordinator, self)
         
+        # Store scheduler in coordinator for access by services
+        coordinator.scheduler = self._scheduler
+        
+        # Cache configuration values that only change via the options flow
+        self._refresh_config()
+        
+        # State attributes are rebuilt only when their inputs change
+        self._cached_attrs: dict[str, Any] | None = None
+        self._cached_attrs_key: tuple = ()
+        self._last_available: bool | None = None
+        
         # Get source entity state to initialize features
         self._update_from_source()
 
@@ -94,6 +124,51 @@ class EnhancedThermostatClimate(CoordinatorEntity, ClimateEntity):
             "sw_version": "1.0.0",
         }
 
+    async def async_added_to_hass(self) -> None:
+        """Index this entity so services can address it directly."""
+        await super().async_added_to_hass()
+        self.hass.data[DOMAIN]["_by_source"][self.entity_id] = self.coordinator
+        self.async_on_remove(
+            self._entry.add_update_listener(self._async_options_updated)
+        )
+        
+        # Safety checks otherwise only run when the source changes
+        if self._cfg_safety_enabled:
+            self._safety_monitor.check_safety(force=True)
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Remove this entity from the service index."""
+        self.hass.data[DOMAIN]["_by_source"].pop(self.entity_id, None)
+        await super().async_will_remove_from_hass()
+
+    @callback
+    def _refresh_config(self) -> None:
+        """Cache configuration values read on every update."""
+        self._cfg_schedule_enabled = self.coordinator.get_config_value(
+            CONF_SCHEDULE_ENABLED, True
+        )
+        self._cfg_safety_enabled = self.coordinator.get_config_value(
+            CONF_SAFETY_ENABLED, True
+        )
+        self._cfg_safety_min = self.coordinator.get_config_value(
+            CONF_SAFETY_MIN_TEMP, DEFAULT_SAFETY_MIN_TEMP
+        )
+        self._cfg_safety_max = self.coordinator.get_config_value(
+            CONF_SAFETY_MAX_TEMP, DEFAULT_SAFETY_MAX_TEMP
+        )
+
+    async def _async_options_updated(
+        self, hass: HomeAssistant, entry: ConfigEntry
+    ) -> None:
+        """Handle options update."""
+        # Don't rely on the integration's reload listener having run first
+        self.coordinator.async_clear_config_cache()
+        self._refresh_config()
+        if self._cfg_safety_enabled:
+            self._safety_monitor.check_safety(force=True)
+        self._update_cached_attrs()
+        self.async_write_ha_state()
+
     @callback
     def _update_from_source(self) -> None:
         """Update thermostat state from source entity."""
@@ -101,41 +176,31 @@ class EnhancedThermostatClimate(CoordinatorEntity, ClimateEntity):
             return
             
         source_state = self.coordinator.data.get("state")
-        source_attrs = self.coordinator.data.get("attributes", {})
+        g = self.coordinator.data.get("attributes", {}).get
         
         # Copy basic attributes
-        self._attr_current_temperature = source_attrs.get("current_temperature")
-        self._attr_target_temperature = source_attrs.get("temperature")
-        self._attr_target_temperature_high = source_attrs.get("target_temp_high")
-        self._attr_target_temperature_low = source_attrs.get("target_temp_low")
-        
-        # Copy HVAC mode
-        try:
-            self._attr_hvac_mode = HVACMode(source_state) if source_state else HVACMode.OFF
-        except ValueError:
-            self._attr_hvac_mode = HVACMode.OFF
+        self._attr_current_temperature = g("current_temperature")
+        self._attr_target_temperature = g("temperature")
+        self._attr_target_temperature_high = g("target_temp_high")
+        self._attr_target_temperature_low = g("target_temp_low")
         
-        # Copy HVAC action
-        hvac_action = source_attrs.get("hvac_action")
-        if hvac_action:
-            try:
-                self._attr_hvac_action = HVACAction(hvac_action)
-            except ValueError:
-                self._attr_hvac_action = None
+        # Copy HVAC mode and action
+        self._attr_hvac_mode = _HVAC_MODE_MAP.get(source_state, HVACMode.OFF)
+        self._attr_hvac_action = _HVAC_ACTION_MAP.get(g("hvac_action"))
         
         # Copy supported features and modes
-        self._attr_hvac_modes = source_attrs.get("hvac_modes", [HVACMode.OFF, HVACMode.HEAT, HVACMode.COOL, HVACMode.HEAT_COOL])
-        self._attr_preset_modes = source_attrs.get("preset_modes", [])
-        self._attr_preset_mode = source_attrs.get("preset_mode")
-        self._attr_fan_modes = source_attrs.get("fan_modes", [])
-        self._attr_fan_mode = source_attrs.get("fan_mode")
-        self._attr_swing_modes = source_attrs.get("swing_modes", [])
-        self._attr_swing_mode = source_attrs.get("swing_mode")
+        self._attr_hvac_modes = g("hvac_modes", _DEFAULT_HVAC_MODES)
+        self._attr_preset_modes = g("preset_modes", [])
+        self._attr_preset_mode = g("preset_mode")
+        self._attr_fan_modes = g("fan_modes", [])
+        self._attr_fan_mode = g("fan_mode")
+        self._attr_swing_modes = g("swing_modes", [])
+        self._attr_swing_mode = g("swing_mode")
         
         # Temperature limits
-        self._attr_max_temp = source_attrs.get("max_temp", 35)
-        self._attr_min_temp = source_attrs.get("min_temp", 7)
-        self._attr_target_temperature_step = source_attrs.get("target_temp_step", 0.5)
+        self._attr_max_temp = g("max_temp", 35)
+        self._attr_min_temp = g("min_temp", 7)
+        self._attr_target_temperature_step = g("target_temp_step", 0.5)
         
         # Determine supported features
         features = ClimateEntityFeature(0)
@@ -155,64 +220,95 @@ class EnhancedThermostatClimate(CoordinatorEntity, ClimateEntity):
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        self._update_from_source()
+        # Skip source sync when the source hasn't changed
+        source_changed = self.coordinator.source_changed
+        if source_changed:
+            self._update_from_source()
         
         # Check scheduler
-        if self.coordinator.get_config_value(CONF_SCHEDULE_ENABLED, True):
+        if self._cfg_schedule_enabled:
             self._scheduler.check_schedule()
         
         # Check safety monitor
-        if self.coordinator.get_config_value(CONF_SAFETY_ENABLED, True):
+        if self._cfg_safety_enabled:
             self._safety_monitor.check_safety()
         
-        self.async_write_ha_state()
+        available = self.coordinator.last_update_success
+        if self._update_cached_attrs() or source_changed or available != self._last_available:
+            self._last_available = available
+            self.async_write_ha_state()
+
+    @callback
+    def _update_cached_attrs(self) -> bool:
+        """Rebuild the cached state attributes when their inputs change.
+
+        Returns True if the attributes were rebuilt.
+        """
+        next_event = (
+            self._scheduler.get_next_event() if self._cfg_schedule_enabled else None
+        )
+        key = (
+            self._cfg_safety_enabled,
+            self._cfg_safety_min,
+            self._cfg_safety_max,
+            self._cfg_schedule_enabled,
+            self.coordinator.safety_triggered,
+            next_event,
+            self.coordinator.override_until,
+        )
+        if self._cached_attrs is not None and key == self._cached_attrs_key:
+            return False
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return entity specific state attributes."""
-        attrs = {}
-        
         # Safety attributes
-        if self.coordinator.get_config_value(CONF_SAFETY_ENABLED, True):
-            attrs[ATTR_SAFETY_ACTIVE] = self.coordinator.safety_triggered
-            attrs["safety_min_temp"] = self.coordinator.get_config_value(
-                CONF_SAFETY_MIN_TEMP, DEFAULT_SAFETY_MIN_TEMP
-            )
-            attrs["safety_max_temp"] = self.coordinator.get_config_value(
-                CONF_SAFETY_MAX_TEMP, DEFAULT_SAFETY_MAX_TEMP
-            )
+        attrs: dict[str, Any] = (
+            {
+                ATTR_SAFETY_ACTIVE: self.coordinator.safety_triggered,
+                "safety_min_temp": self._cfg_safety_min,
+                "safety_max_temp": self._cfg_safety_max,
+            }
+            if self._cfg_safety_enabled
+            else {}
+        )
         
         # Schedule attributes
-        if self.coordinator.get_config_value(CONF_SCHEDULE_ENABLED, True):
-            next_event = self._scheduler.get_next_event()
-            attrs[ATTR_SCHEDULE_ACTIVE] = next_event is not None
-            attrs[ATTR_NEXT_SCHEDULE_EVENT] = next_event
+        if self._cfg_schedule_enabled:
+            attrs.update(
+                {
+                    ATTR_SCHEDULE_ACTIVE: next_event is not None,
+                    ATTR_NEXT_SCHEDULE_EVENT: next_event,
+                }
+            )
         
         # Override attributes
-        if self.coordinator.override_until:
-            attrs[ATTR_OVERRIDE_UNTIL] = self.coordinator.override_until
+        if self.coordinator.override_until is not None:
+            attrs[ATTR_OVERRIDE_UNTIL] = self.coordinator.override_until_iso
         
-        return attrs
+        self._cached_attrs = attrs
+        self._cached_attrs_key = key
+        return True
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return entity specific state attributes."""
+        if self._cached_attrs is None:
+            self._update_cached_attrs()
+        return self._cached_attrs
 
     async def async_set_temperature(self, **kwargs: Any) -> None:
         """Set new target temperature."""
-        temperature = kwargs.get(ATTR_TEMPERATURE)
-        target_temp_high = kwargs.get("target_temp_high")
-        target_temp_low = kwargs.get("target_temp_low")
-        hvac_mode = kwargs.get("hvac_mode")
-        
         service_data = {
             "entity_id": self.coordinator.source_entity_id,
+            **{
+                key: value
+                for key in _SET_TEMPERATURE_KEYS
+                if (value := kwargs.get(key)) is not None
+            },
         }
         
-        if temperature is not None:
-            service_data[ATTR_TEMPERATURE] = temperature
-        if target_temp_high is not None:
-            service_data["target_temp_high"] = target_temp_high
-        if target_temp_low is not None:
-            service_data["target_temp_low"] = target_temp_low
-        if hvac_mode is not None:
-            service_data["hvac_mode"] = hvac_mode
+        # Next scheduled event doesn't depend on the service call result
+        next_event = (
+            self._scheduler.get_next_event() if self._cfg_schedule_enabled else None
+        )
         
         await self.hass.services.async_call(
             "climate",
@@ -222,13 +318,16 @@ class EnhancedThermostatClimate(CoordinatorEntity, ClimateEntity):
         )
         
         # Set override until next scheduled event
-        if self.coordinator.get_config_value(CONF_SCHEDULE_ENABLED, True):
-            next_event = self._scheduler.get_next_event()
-            if next_event:
-                self.coordinator.override_until = next_event["time"]
+        if next_event:
+            self.coordinator.override_until = next_event["time"]
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Set new target hvac mode."""
+        # Next scheduled event doesn't depend on the service call result
+        next_event = (
+            self._scheduler.get_next_event() if self._cfg_schedule_enabled else None
+        )
+        
         await self.hass.services.async_call(
             "climate",
             "set_hvac_mode",
@@ -240,10 +339,8 @@ class EnhancedThermostatClimate(CoordinatorEntity, ClimateEntity):
         )
         
         # Set override until next scheduled event
-        if self.coordinator.get_config_value(CONF_SCHEDULE_ENABLED, True):
-            next_event = self._scheduler.get_next_event()
-            if next_event:
-                self.coordinator.override_until = next_event["time"]
+        if next_event:
+            self.coordinator.override_until = next_event["time"]
 
     async def async_set_preset_mode(self, preset_mode: str) -> None:
         """Set new preset mode."""
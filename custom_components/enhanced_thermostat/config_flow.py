@@ -9,7 +9,7 @@ import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.const import CONF_NAME
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers import entity_registry as er, selector
+from homeassistant.helpers import selector
 from homeassistant.components.climate import DOMAIN as CLIMATE_DOMAIN
 
 from .const import (
@@ -31,6 +31,59 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+USER_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_SOURCE_ENTITY): selector.EntitySelector(
+            selector.EntitySelectorConfig(domain=CLIMATE_DOMAIN)
+        ),
+        vol.Optional(CONF_NAME): str,
+    }
+)
+
+SAFETY_SCHEMA = vol.Schema(
+    {
+        vol.Optional(
+            CONF_SAFETY_ENABLED,
+            default=DEFAULT_SAFETY_ENABLED,
+        ): bool,
+        vol.Optional(
+            CONF_SAFETY_MIN_TEMP,
+            default=DEFAULT_SAFETY_MIN_TEMP,
+        ): vol.All(vol.Coerce(float), vol.Range(min=-10, max=40)),
+        vol.Optional(
+            CONF_SAFETY_MAX_TEMP,
+            default=DEFAULT_SAFETY_MAX_TEMP,
+        ): vol.All(vol.Coerce(float), vol.Range(min=-10, max=50)),
+        vol.Optional(
+            CONF_HYSTERESIS,
+            default=DEFAULT_HYSTERESIS,
+        ): vol.All(vol.Coerce(float), vol.Range(min=0.1, max=5.0)),
+    }
+)
+
+FEATURES_SCHEMA = vol.Schema(
+    {
+        vol.Optional(
+            CONF_SCHEDULE_ENABLED,
+            default=DEFAULT_SCHEDULE_ENABLED,
+        ): bool,
+        vol.Optional(
+            CONF_TRACKING_ENABLED,
+            default=DEFAULT_TRACKING_ENABLED,
+        ): bool,
+    }
+)
+
+# Same fields without defaults, so the entry's current values (applied as
+# suggested values when the form is shown) aren't replaced by global defaults
+OPTIONS_SCHEMA = vol.Schema(
+    {
+        vol.Optional(str(key)): validator
+        for key, validator in {**SAFETY_SCHEMA.schema, **FEATURES_SCHEMA.schema}.items()
+    }
+)
+OPTION_KEYS = tuple(str(key) for key in OPTIONS_SCHEMA.schema)
+
 
 async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str, Any]:
     """Validate the user input allows us to connect."""
@@ -83,31 +136,9 @@ class EnhancedThermostatConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 _LOGGER.exception("Unexpected exception")
                 errors["base"] = "cannot_connect"
 
-        # Get all climate entities
-        entity_registry = er.async_get(self.hass)
-        climate_entities = [
-            entry.entity_id
-            for entry in entity_registry.entities.values()
-            if entry.domain == CLIMATE_DOMAIN
-        ]
-        
-        # Also include climate entities from states
-        for state in self.hass.states.async_all(CLIMATE_DOMAIN):
-            if state.entity_id not in climate_entities:
-                climate_entities.append(state.entity_id)
-
-        data_schema = vol.Schema(
-            {
-                vol.Required(CONF_SOURCE_ENTITY): selector.EntitySelector(
-                    selector.EntitySelectorConfig(domain=CLIMATE_DOMAIN)
-                ),
-                vol.Optional(CONF_NAME): str,
-            }
-        )
-
         return self.async_show_form(
             step_id="user",
-            data_schema=data_schema,
+            data_schema=USER_SCHEMA,
             errors=errors,
         )
 
@@ -134,30 +165,9 @@ class EnhancedThermostatConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 _LOGGER.exception("Unexpected exception")
                 errors["base"] = "cannot_connect"
 
-        data_schema = vol.Schema(
-            {
-                vol.Optional(
-                    CONF_SAFETY_ENABLED,
-                    default=DEFAULT_SAFETY_ENABLED,
-                ): bool,
-                vol.Optional(
-                    CONF_SAFETY_MIN_TEMP,
-                    default=DEFAULT_SAFETY_MIN_TEMP,
-                ): vol.All(vol.Coerce(float), vol.Range(min=-10, max=40)),
-                vol.Optional(
-                    CONF_SAFETY_MAX_TEMP,
-                    default=DEFAULT_SAFETY_MAX_TEMP,
-                ): vol.All(vol.Coerce(float), vol.Range(min=-10, max=50)),
-                vol.Optional(
-                    CONF_HYSTERESIS,
-                    default=DEFAULT_HYSTERESIS,
-                ): vol.All(vol.Coerce(float), vol.Range(min=0.1, max=5.0)),
-            }
-        )
-
         return self.async_show_form(
             step_id="safety",
-            data_schema=data_schema,
+            data_schema=SAFETY_SCHEMA,
             errors=errors,
         )
 
@@ -176,22 +186,9 @@ class EnhancedThermostatConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 data=self._data,
             )
 
-        data_schema = vol.Schema(
-            {
-                vol.Optional(
-                    CONF_SCHEDULE_ENABLED,
-                    default=DEFAULT_SCHEDULE_ENABLED,
-                ): bool,
-                vol.Optional(
-                    CONF_TRACKING_ENABLED,
-                    default=DEFAULT_TRACKING_ENABLED,
-                ): bool,
-            }
-        )
-
         return self.async_show_form(
             step_id="features",
-            data_schema=data_schema,
+            data_schema=FEATURES_SCHEMA,
         )
 
     @staticmethod
@@ -211,12 +208,24 @@ class EnhancedThermostatOptionsFlow(config_entries.OptionsFlow):
     ) -> config_entries.FlowResult:
         """Manage the options."""
         errors: dict[str, str] = {}
+        current_config = {**self.config_entry.data, **self.config_entry.options}
 
         if user_input is not None:
+            # Fields left empty keep the entry's current value
+            user_input = {
+                **{
+                    key: current_config[key]
+                    for key in OPTION_KEYS
+                    if key in current_config
+                },
+                **user_input,
+            }
             try:
                 # Validate temperature range if safety is enabled
                 if user_input.get(CONF_SAFETY_ENABLED, True):
-                    if user_input[CONF_SAFETY_MAX_TEMP] <= user_input[CONF_SAFETY_MIN_TEMP]:
+                    if user_input.get(
+                        CONF_SAFETY_MAX_TEMP, DEFAULT_SAFETY_MAX_TEMP
+                    ) <= user_input.get(CONF_SAFETY_MIN_TEMP, DEFAULT_SAFETY_MIN_TEMP):
                         errors["base"] = "invalid_temp_range"
                     else:
                         return self.async_create_entry(title="", data=user_input)
@@ -227,39 +236,10 @@ class EnhancedThermostatOptionsFlow(config_entries.OptionsFlow):
                 _LOGGER.exception("Unexpected exception")
                 errors["base"] = "cannot_connect"
 
-        current_config = {**self.config_entry.data, **self.config_entry.options}
-
-        data_schema = vol.Schema(
-            {
-                vol.Optional(
-                    CONF_SAFETY_ENABLED,
-                    default=current_config.get(CONF_SAFETY_ENABLED, DEFAULT_SAFETY_ENABLED),
-                ): bool,
-                vol.Optional(
-                    CONF_SAFETY_MIN_TEMP,
-                    default=current_config.get(CONF_SAFETY_MIN_TEMP, DEFAULT_SAFETY_MIN_TEMP),
-                ): vol.All(vol.Coerce(float), vol.Range(min=-10, max=40)),
-                vol.Optional(
-                    CONF_SAFETY_MAX_TEMP,
-                    default=current_config.get(CONF_SAFETY_MAX_TEMP, DEFAULT_SAFETY_MAX_TEMP),
-                ): vol.All(vol.Coerce(float), vol.Range(min=-10, max=50)),
-                vol.Optional(
-                    CONF_HYSTERESIS,
-                    default=current_config.get(CONF_HYSTERESIS, DEFAULT_HYSTERESIS),
-                ): vol.All(vol.Coerce(float), vol.Range(min=0.1, max=5.0)),
-                vol.Optional(
-                    CONF_SCHEDULE_ENABLED,
-                    default=current_config.get(CONF_SCHEDULE_ENABLED, DEFAULT_SCHEDULE_ENABLED),
-                ): bool,
-                vol.Optional(
-                    CONF_TRACKING_ENABLED,
-                    default=current_config.get(CONF_TRACKING_ENABLED, DEFAULT_TRACKING_ENABLED),
-                ): bool,
-            }
-        )
-
         return self.async_show_form(
             step_id="init",
-            data_schema=data_schema,
+            data_schema=self.add_suggested_values_to_schema(
+                OPTIONS_SCHEMA, current_config
+            ),
             errors=errors,
         )
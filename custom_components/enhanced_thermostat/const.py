@@ -38,7 +38,7 @@ SERVICE_CLEAR_OVERRIDE: Final = "clear_override"
 SERVICE_EXPORT_USAGE: Final = "export_usage"
 
 # Days of week
-DAYS_OF_WEEK: Final = [
+DAYS_OF_WEEK: Final = (
     "monday",
     "tuesday",
     "wednesday",
@@ -46,11 +46,14 @@ DAYS_OF_WEEK: Final = [
     "friday",
     "saturday",
     "sunday",
-]
+)
+DAYS_OF_WEEK_SET: Final = frozenset(DAYS_OF_WEEK)
+DAY_INDEX: Final = {day: index for index, day in enumerate(DAYS_OF_WEEK)}
 
 # Update intervals
 UPDATE_INTERVAL_SECONDS: Final = 30
 TRACKING_INTERVAL_SECONDS: Final = 60
+SERVICE_COALESCE_SECONDS: Final = 0.2
 
 # Notification
 NOTIFICATION_ID: Final = "enhanced_thermostat_safety"
@@ -1,24 +1,74 @@
 """Coordinator for Enhanced Thermostat integration."""
 from __future__ import annotations
 
-from datetime import timedelta
+import asyncio
+from datetime import datetime, timedelta
 import logging
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, State, callback
+from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.helpers import entity_registry as er
+from homeassistant.util import dt as dt_util
 
 from .const import (
     DOMAIN,
     UPDATE_INTERVAL_SECONDS,
+    SERVICE_COALESCE_SECONDS,
     CONF_SOURCE_ENTITY,
+    CONF_TRACKING_ENABLED,
 )
+from .tracker import EnhancedThermostatUsageTracker
+
+if TYPE_CHECKING:
+    from .scheduler import ThermostatScheduler
 
 _LOGGER = logging.getLogger(__name__)
 
 
+class ServiceCoalescer:
+    """Collapse identical service calls issued in quick succession."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the coalescer."""
+        self.hass = hass
+        self._pending: dict[tuple, asyncio.TimerHandle] = {}
+
+    @callback
+    def submit(self, domain: str, service: str, data: dict[str, Any]) -> None:
+        """Queue a service call, replacing any pending one for the same entity.
+
+        The replacement is rescheduled, so queued calls fire in the order they
+        were last submitted and the latest data wins.
+        """
+        key = (domain, service, data.get("entity_id"))
+        if (handle := self._pending.pop(key, None)) is not None:
+            handle.cancel()
+
+        self._pending[key] = self.hass.loop.call_later(
+            SERVICE_COALESCE_SECONDS, self._fire, key, domain, service, data
+        )
+
+    @callback
+    def cancel_all(self) -> None:
+        """Drop all queued service calls."""
+        for handle in self._pending.values():
+            handle.cancel()
+        self._pending.clear()
+
+    @callback
+    def _fire(
+        self, key: tuple, domain: str, service: str, data: dict[str, Any]
+    ) -> None:
+        """Issue a queued service call."""
+        self._pending.pop(key, None)
+        self.hass.async_create_task(
+            self.hass.services.async_call(domain, service, data, blocking=False)
+        )
+
+
 class EnhancedThermostatCoordinator(DataUpdateCoordinator):
     """Class to manage fetching Enhanced Thermostat data."""
 
@@ -31,10 +81,20 @@ class EnhancedThermostatCoordinator(DataUpdateCoordinator):
             update_interval=timedelta(seconds=UPDATE_INTERVAL_SECONDS),
         )
         self.config_entry = entry
+        self._cfg_cache: dict[str, Any] | None = None
+        self.service_coalescer = ServiceCoalescer(hass)
+        # Set by the climate entity once its platform is set up
+        self.scheduler: ThermostatScheduler | None = None
         self._source_entity_id = entry.data.get(CONF_SOURCE_ENTITY, "")
         self._schedule_data: dict[str, list[dict[str, Any]]] = {}
-        self._override_until: str | None = None
+        self._override_until: datetime | None = None
         self._safety_triggered: bool = False
+        self._last_source_updated: datetime | None = None
+        self._source_changed: bool = False
+        self._tracking_enabled: bool = self.get_config_value(CONF_TRACKING_ENABLED, True)
+        self.usage_tracker: EnhancedThermostatUsageTracker | None = (
+            EnhancedThermostatUsageTracker() if self._tracking_enabled else None
+        )
 
     @property
     def source_entity_id(self) -> str:
@@ -46,6 +106,16 @@ class EnhancedThermostatCoordinator(DataUpdateCoordinator):
         """Set the source entity ID."""
         self._source_entity_id = value
 
+    @property
+    def source_changed(self) -> bool:
+        """Return if the source entity changed in the last update."""
+        return self._source_changed
+
+    @property
+    def tracking_enabled(self) -> bool:
+        """Return if usage tracking was enabled when the entry was set up."""
+        return self._tracking_enabled
+
     @property
     def schedule_data(self) -> dict[str, list[dict[str, Any]]]:
         """Return the schedule data."""
@@ -57,14 +127,23 @@ class EnhancedThermostatCoordinator(DataUpdateCoordinator):
         self._schedule_data = value
 
     @property
-    def override_until(self) -> str | None:
+    def override_until(self) -> datetime | None:
         """Return the override timestamp."""
         return self._override_until
 
     @override_until.setter
-    def override_until(self, value: str | None) -> None:
-        """Set the override timestamp."""
-        self._override_until = value
+    def override_until(self, value: str | datetime | None) -> None:
+        """Set the override timestamp, parsing ISO strings once."""
+        if isinstance(value, str):
+            value = datetime.fromisoformat(value)
+        self._override_until = None if value is None else dt_util.as_local(value)
+
+    @property
+    def override_until_iso(self) -> str | None:
+        """Return the override timestamp in ISO format."""
+        if self._override_until is None:
+            return None
+        return self._override_until.isoformat()
 
     @property
     def safety_triggered(self) -> bool:
@@ -76,8 +155,40 @@ class EnhancedThermostatCoordinator(DataUpdateCoordinator):
         """Set safety triggered state."""
         self._safety_triggered = value
 
+    @callback
+    def async_track_source(self) -> CALLBACK_TYPE:
+        """Push source entity state changes to listeners as they happen."""
+        return async_track_state_change_event(
+            self.hass, [self._source_entity_id], self._async_handle_source_change
+        )
+
+    @callback
+    def _async_handle_source_change(self, event: Event) -> None:
+        """Handle a state change of the source entity."""
+        if (new_state := event.data.get("new_state")) is None:
+            # The next poll reports the missing entity
+            return
+
+        self.async_set_updated_data(self._process_source_state(new_state))
+
+    def _process_source_state(self, source_state: State) -> dict[str, Any]:
+        """Record a source state and build the coordinator data from it."""
+        self._source_changed = source_state.last_updated != self._last_source_updated
+        self._last_source_updated = source_state.last_updated
+
+        # Track usage once per update, independent of which sensors exist
+        if self.usage_tracker is not None:
+            self.usage_tracker.update(source_state.attributes.get("hvac_action"))
+
+        return {
+            "state": source_state.state,
+            "attributes": source_state.attributes,
+            "last_updated": source_state.last_updated,
+        }
+
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch data from source entity."""
+        self._source_changed = False
         try:
             if not self._source_entity_id:
                 raise UpdateFailed("Source entity not configured")
@@ -87,17 +198,18 @@ class EnhancedThermostatCoordinator(DataUpdateCoordinator):
             if source_state is None:
                 raise UpdateFailed(f"Source entity {self._source_entity_id} not found")
 
-            return {
-                "state": source_state.state,
-                "attributes": dict(source_state.attributes),
-                "last_updated": source_state.last_updated,
-            }
+            return self._process_source_state(source_state)
 
         except Exception as err:
             raise UpdateFailed(f"Error communicating with source entity: {err}") from err
 
     def get_config_value(self, key: str, default: Any = None) -> Any:
         """Get a configuration value from entry data or options."""
-        if key in self.config_entry.options:
-            return self.config_entry.options[key]
-        return self.config_entry.data.get(key, default)
+        if self._cfg_cache is None:
+            self._cfg_cache = {**self.config_entry.data, **self.config_entry.options}
+        return self._cfg_cache.get(key, default)
+
+    @callback
+    def async_clear_config_cache(self) -> None:
+        """Drop cached configuration values after the entry was updated."""
+        self._cfg_cache = None
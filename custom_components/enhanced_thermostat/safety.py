@@ -24,10 +24,25 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
+_ALERT_MSG_TMPL = (
+    "⚠️ Safety temperature alert!\n\n"
+    "Current temperature: {current:.1f}°C\n"
+    "Safety {limit_name}: {limit:.1f}°C\n\n"
+    "Thermostat has been automatically set to {mode} mode "
+    "with target temperature {target:.1f}°C."
+)
+_RESOLVED_MSG = (
+    "✅ Safety temperature alert resolved!\n\n"
+    "Temperature has returned to safe levels. "
+    "Thermostat has been returned to OFF mode."
+)
+
 
 class SafetyMonitor:
     """Monitor and enforce safety temperature limits."""
 
+    __slots__ = ("coordinator", "climate_entity", "_last_safety_mode")
+
     def __init__(
         self,
         coordinator: EnhancedThermostatCoordinator,
@@ -38,11 +53,18 @@ class SafetyMonitor:
         self.climate_entity = climate_entity
         self._last_safety_mode: str | None = None
 
-    def check_safety(self) -> None:
-        """Check if safety temperature action is needed."""
+    def check_safety(self, force: bool = False) -> None:
+        """Check if safety temperature action is needed.
+
+        Unless forced, the check is skipped when the source entity hasn't
+        changed since the last update.
+        """
         if not self.coordinator.data:
             return
 
+        if not force and not self.coordinator.source_changed:
+            return
+
         current_temp = self.coordinator.data["attributes"].get("current_temperature")
         hvac_mode = self.coordinator.data.get("state")
 
@@ -75,7 +97,7 @@ class SafetyMonitor:
                     current_temp,
                     safety_min,
                 )
-                self._activate_safety_heating(current_temp, safety_min)
+                self._activate_safety_heating(current_temp, safety_min, hysteresis)
 
         # Check for dangerous high temperature
         elif current_temp > safety_max:
@@ -85,7 +107,7 @@ class SafetyMonitor:
                     current_temp,
                     safety_max,
                 )
-                self._activate_safety_cooling(current_temp, safety_max)
+                self._activate_safety_cooling(current_temp, safety_max, hysteresis)
 
         # Check if we can deactivate safety mode (with hysteresis)
         elif self.coordinator.safety_triggered:
@@ -102,36 +124,33 @@ class SafetyMonitor:
                 )
                 self._deactivate_safety()
 
-    def _activate_safety_heating(self, current_temp: float, safety_min: float) -> None:
+    def _activate_safety_heating(
+        self, current_temp: float, safety_min: float, hysteresis: float
+    ) -> None:
         """Activate safety heating mode."""
         self.coordinator.safety_triggered = True
         self._last_safety_mode = "heat"
 
         # Set thermostat to heat mode with target temperature
-        target_temp = safety_min + self.coordinator.get_config_value(
-            CONF_HYSTERESIS, DEFAULT_HYSTERESIS
-        )
-
-        self.coordinator.hass.async_create_task(
-            self.coordinator.hass.services.async_call(
-                "climate",
-                "set_temperature",
-                {
-                    "entity_id": self.coordinator.source_entity_id,
-                    "hvac_mode": HVACMode.HEAT,
-                    "temperature": target_temp,
-                },
-                blocking=False,
-            )
+        target_temp = safety_min + hysteresis
+
+        self.coordinator.service_coalescer.submit(
+            "climate",
+            "set_temperature",
+            {
+                "entity_id": self.coordinator.source_entity_id,
+                "hvac_mode": HVACMode.HEAT,
+                "temperature": target_temp,
+            },
         )
 
         # Send notification
-        message = (
-            f"⚠️ Safety temperature alert!\n\n"
-            f"Current temperature: {current_temp:.1f}°C\n"
-            f"Safety minimum: {safety_min:.1f}°C\n\n"
-            f"Thermostat has been automatically set to HEAT mode "
-            f"with target temperature {target_temp:.1f}°C."
+        message = _ALERT_MSG_TMPL.format(
+            current=current_temp,
+            limit_name="minimum",
+            limit=safety_min,
+            mode="HEAT",
+            target=target_temp,
         )
 
         async_create(
@@ -141,36 +160,33 @@ class SafetyMonitor:
             notification_id=f"{NOTIFICATION_ID}_heat",
         )
 
-    def _activate_safety_cooling(self, current_temp: float, safety_max: float) -> None:
+    def _activate_safety_cooling(
+        self, current_temp: float, safety_max: float, hysteresis: float
+    ) -> None:
         """Activate safety cooling mode."""
         self.coordinator.safety_triggered = True
         self._last_safety_mode = "cool"
 
         # Set thermostat to cool mode with target temperature
-        target_temp = safety_max - self.coordinator.get_config_value(
-            CONF_HYSTERESIS, DEFAULT_HYSTERESIS
-        )
-
-        self.coordinator.hass.async_create_task(
-            self.coordinator.hass.services.async_call(
-                "climate",
-                "set_temperature",
-                {
-                    "entity_id": self.coordinator.source_entity_id,
-                    "hvac_mode": HVACMode.COOL,
-                    "temperature": target_temp,
-                },
-                blocking=False,
-            )
+        target_temp = safety_max - hysteresis
+
+        self.coordinator.service_coalescer.submit(
+            "climate",
+            "set_temperature",
+            {
+                "entity_id": self.coordinator.source_entity_id,
+                "hvac_mode": HVACMode.COOL,
+                "temperature": target_temp,
+            },
         )
 
         # Send notification
-        message = (
-            f"⚠️ Safety temperature alert!\n\n"
-            f"Current temperature: {current_temp:.1f}°C\n"
-            f"Safety maximum: {safety_max:.1f}°C\n\n"
-            f"Thermostat has been automatically set to COOL mode "
-            f"with target temperature {target_temp:.1f}°C."
+        message = _ALERT_MSG_TMPL.format(
+            current=current_temp,
+            limit_name="maximum",
+            limit=safety_max,
+            mode="COOL",
+            target=target_temp,
         )
 
         async_create(
@@ -186,28 +202,19 @@ class SafetyMonitor:
         self._last_safety_mode = None
 
         # Turn thermostat back off
-        self.coordinator.hass.async_create_task(
-            self.coordinator.hass.services.async_call(
-                "climate",
-                "set_hvac_mode",
-                {
-                    "entity_id": self.coordinator.source_entity_id,
-                    "hvac_mode": HVACMode.OFF,
-                },
-                blocking=False,
-            )
+        self.coordinator.service_coalescer.submit(
+            "climate",
+            "set_hvac_mode",
+            {
+                "entity_id": self.coordinator.source_entity_id,
+                "hvac_mode": HVACMode.OFF,
+            },
         )
 
         # Send notification
-        message = (
-            "✅ Safety temperature alert resolved!\n\n"
-            "Temperature has returned to safe levels. "
-            "Thermostat has been returned to OFF mode."
-        )
-
         async_create(
             self.coordinator.hass,
-            message,
+            _RESOLVED_MSG,
             title=NOTIFICATION_TITLE,
             notification_id=f"{NOTIFICATION_ID}_resolved",
         )
@@ -1,13 +1,15 @@
 """Scheduler for Enhanced Thermostat."""
 from __future__ import annotations
 
+from bisect import bisect_right
 from datetime import datetime, time, timedelta
 import logging
 from typing import Any, TYPE_CHECKING
 
 from homeassistant.components.climate import HVACMode
+from homeassistant.util import dt as dt_util
 
-from .const import DAYS_OF_WEEK
+from .const import DAYS_OF_WEEK, DAYS_OF_WEEK_SET, DAY_INDEX
 
 if TYPE_CHECKING:
     from .coordinator import EnhancedThermostatCoordinator
@@ -18,48 +20,45 @@ _LOGGER = logging.getLogger(__name__)
 class ThermostatScheduler:
     """Manage thermostat scheduling."""
 
+    __slots__ = ("coordinator", "_last_executed", "_schedule_by_weekday")
+
     def __init__(self, coordinator: EnhancedThermostatCoordinator) -> None:
         """Initialize the scheduler."""
         self.coordinator = coordinator
         self._last_executed: datetime | None = None
+        # Per-weekday event start times (seconds since midnight) and events, sorted
+        self._schedule_by_weekday: list[tuple[list[int], list[dict[str, Any]]]] = [
+            ([], []) for _ in DAYS_OF_WEEK
+        ]
+        for day in self.coordinator.schedule_data:
+            self._rebuild_day(day)
 
     def check_schedule(self) -> None:
         """Check if a scheduled action should be executed."""
+        now = dt_util.now()
+
         # Check if override is active
-        if self.coordinator.override_until:
-            override_time = datetime.fromisoformat(self.coordinator.override_until)
-            if datetime.now() < override_time:
+        if (override_time := self.coordinator.override_until) is not None:
+            if now < override_time:
                 _LOGGER.debug("Schedule check skipped: Override active until %s", override_time)
                 return
             else:
                 # Clear expired override
                 self.coordinator.override_until = None
 
-        # Get current day and time
-        now = datetime.now()
-        current_day = DAYS_OF_WEEK[now.weekday()]
-        current_time = now.time()
-
-        # Get schedule for current day
-        day_schedule = self.coordinator.schedule_data.get(current_day, [])
-        
-        if not day_schedule:
-            return
+        # Get current time
+        now_secs = now.hour * 3600 + now.minute * 60 + now.second
 
         # Find the most recent schedule event that should have triggered
-        current_event = None
-        for event in sorted(day_schedule, key=lambda x: self._parse_time(x["time"])):
-            event_time = self._parse_time(event["time"])
-            if event_time <= current_time:
-                current_event = event
-            else:
-                break
-
-        if not current_event:
+        times, events = self._schedule_by_weekday[now.weekday()]
+        index = bisect_right(times, now_secs) - 1
+        if index < 0:
             return
 
+        current_event = events[index]
+
         # Check if we need to execute this event
-        event_datetime = datetime.combine(now.date(), self._parse_time(current_event["time"]))
+        event_datetime = self._event_datetime(now, times[index])
         
         # Only execute if we haven't executed this event yet today
         if self._last_executed is None or event_datetime > self._last_executed:
@@ -81,104 +80,139 @@ class ThermostatScheduler:
         if temperature is not None and hvac_mode != HVACMode.OFF:
             service_data["temperature"] = temperature
 
-        self.coordinator.hass.async_create_task(
-            self.coordinator.hass.services.async_call(
-                "climate",
-                "set_temperature",
-                service_data,
-                blocking=False,
-            )
+        self.coordinator.service_coalescer.submit(
+            "climate",
+            "set_temperature",
+            service_data,
         )
 
     def get_next_event(self) -> dict[str, Any] | None:
         """Get the next scheduled event."""
-        now = datetime.now()
+        now = dt_util.now()
         current_day_index = now.weekday()
-        current_time = now.time()
+        now_secs = now.hour * 3600 + now.minute * 60 + now.second
 
         # Check remaining events today
-        current_day = DAYS_OF_WEEK[current_day_index]
-        day_schedule = self.coordinator.schedule_data.get(current_day, [])
-        
-        for event in sorted(day_schedule, key=lambda x: self._parse_time(x["time"])):
-            event_time = self._parse_time(event["time"])
-            if event_time > current_time:
-                return {
-                    "day": current_day,
-                    "time": datetime.combine(now.date(), event_time).isoformat(),
-                    "mode": event.get("mode", HVACMode.OFF),
-                    "temperature": event.get("temperature"),
-                }
+        times, events = self._schedule_by_weekday[current_day_index]
+        index = bisect_right(times, now_secs)
+        if index < len(times):
+            return self._build_next_event(
+                now, current_day_index, 0, times[index], events[index]
+            )
 
         # Check next 7 days
         for days_ahead in range(1, 8):
             check_day_index = (current_day_index + days_ahead) % 7
-            check_day = DAYS_OF_WEEK[check_day_index]
-            day_schedule = self.coordinator.schedule_data.get(check_day, [])
+            times, events = self._schedule_by_weekday[check_day_index]
             
-            if day_schedule:
+            if times:
                 # Get first event of the day
-                first_event = min(day_schedule, key=lambda x: self._parse_time(x["time"]))
-                event_date = now.date() + timedelta(days=days_ahead)
-                event_time = self._parse_time(first_event["time"])
-                
-                return {
-                    "day": check_day,
-                    "time": datetime.combine(event_date, event_time).isoformat(),
-                    "mode": first_event.get("mode", HVACMode.OFF),
-                    "temperature": first_event.get("temperature"),
-                }
+                return self._build_next_event(
+                    now, check_day_index, days_ahead, times[0], events[0]
+                )
 
         return None
 
+    def _build_next_event(
+        self,
+        now: datetime,
+        day_index: int,
+        days_ahead: int,
+        secs: int,
+        event: dict[str, Any],
+    ) -> dict[str, Any]:
+        """Build the next event description for a cached schedule entry."""
+        return {
+            "day": DAYS_OF_WEEK[day_index],
+            "time": self._event_datetime(now, secs, days_ahead).isoformat(),
+            "mode": event.get("mode", HVACMode.OFF),
+            "temperature": event.get("temperature"),
+        }
+
     @staticmethod
-    def _parse_time(time_str: str) -> time:
-        """Parse time string to time object."""
+    def _event_datetime(now: datetime, secs: int, days_ahead: int = 0) -> datetime:
+        """Return when an event starting secs after midnight occurs, days_ahead from now."""
+        return datetime.combine(
+            now.date() + timedelta(days=days_ahead),
+            time(secs // 3600, secs % 3600 // 60),
+            tzinfo=now.tzinfo,
+        )
+
+    def _rebuild_day(self, day: str) -> None:
+        """Rebuild the sorted schedule cache for a day."""
+        keyed = [
+            (secs, event)
+            for event in self.coordinator.schedule_data.get(day, ())
+            if (secs := self._parse_secs(event["time"])) is not None
+        ]
+        keyed.sort(key=lambda item: item[0])
+
+        self._schedule_by_weekday[DAY_INDEX[day]] = (
+            [secs for secs, _ in keyed],
+            [event for _, event in keyed],
+        )
+
+    @staticmethod
+    def _parse_secs(time_str: str) -> int | None:
+        """Parse an HH:MM time string to seconds since midnight."""
         try:
-            return datetime.strptime(time_str, "%H:%M").time()
-        except ValueError:
-            _LOGGER.error("Invalid time format: %s", time_str)
-            return time(0, 0)
+            hours, minutes = time_str.split(":")
+            hour, minute = int(hours), int(minutes)
+        except (AttributeError, ValueError):
+            return None
+        if not (0 <= hour < 24 and 0 <= minute < 60):
+            return None
+        return hour * 3600 + minute * 60
 
     def set_schedule(self, day: str, events: list[dict[str, Any]]) -> None:
         """Set schedule for a specific day."""
-        if day not in DAYS_OF_WEEK:
+        if day not in DAYS_OF_WEEK_SET:
             _LOGGER.error("Invalid day: %s", day)
             return
 
         # Validate events
         validated_events = []
         for event in events:
-            if "time" not in event or "mode" not in event:
+            if not isinstance(event, dict) or "time" not in event or "mode" not in event:
                 _LOGGER.error("Invalid event format: %s", event)
                 continue
             
             # Validate time format
-            try:
-                self._parse_time(event["time"])
-            except Exception:
+            if self._parse_secs(event["time"]) is None:
                 _LOGGER.error("Invalid time in event: %s", event)
                 continue
 
+            # Normalize mode and temperature, which are passed on to service calls
+            try:
+                event = {**event, "mode": HVACMode(event["mode"])}
+                if event.get("temperature") is not None:
+                    event["temperature"] = float(event["temperature"])
+            except (TypeError, ValueError):
+                _LOGGER.error("Invalid mode or temperature in event: %s", event)
+                continue
+
             validated_events.append(event)
 
         self.coordinator.schedule_data[day] = validated_events
+        self._rebuild_day(day)
         _LOGGER.info("Schedule set for %s: %s", day, validated_events)
 
     def clear_schedule(self, day: str | None = None) -> None:
         """Clear schedule for a specific day or all days."""
         if day is None:
             self.coordinator.schedule_data = {}
+            self._schedule_by_weekday = [([], []) for _ in DAYS_OF_WEEK]
             _LOGGER.info("All schedules cleared")
-        elif day in DAYS_OF_WEEK:
+        elif day in DAYS_OF_WEEK_SET:
             self.coordinator.schedule_data.pop(day, None)
+            self._schedule_by_weekday[DAY_INDEX[day]] = ([], [])
             _LOGGER.info("Schedule cleared for %s", day)
         else:
             _LOGGER.error("Invalid day: %s", day)
 
     def copy_schedule(self, from_day: str, to_day: str) -> None:
         """Copy schedule from one day to another."""
-        if from_day not in DAYS_OF_WEEK or to_day not in DAYS_OF_WEEK:
+        if from_day not in DAYS_OF_WEEK_SET or to_day not in DAYS_OF_WEEK_SET:
             _LOGGER.error("Invalid day: %s or %s", from_day, to_day)
             return
 
@@ -187,4 +221,5 @@ class ThermostatScheduler:
             return
 
         self.coordinator.schedule_data[to_day] = self.coordinator.schedule_data[from_day].copy()
+        self._rebuild_day(to_day)
         _LOGGER.info("Schedule copied from %s to %s", from_day, to_day)
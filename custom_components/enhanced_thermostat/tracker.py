@@ -0,0 +1,124 @@
+"""Usage tracking for Enhanced Thermostat."""
+from __future__ import annotations
+
+from datetime import date, timedelta
+import io
+import logging
+from time import monotonic
+
+from homeassistant.components.climate import HVACAction
+from homeassistant.util import dt as dt_util
+
+_LOGGER = logging.getLogger(__name__)
+
+_TRACKED_ACTIONS = frozenset((HVACAction.HEATING, HVACAction.COOLING))
+
+
+class EnhancedThermostatUsageTracker:
+    """Track HVAC usage for reporting."""
+
+    __slots__ = (
+        "_action_start",
+        "_current_action",
+        "_daily_heating_seconds",
+        "_daily_cooling_seconds",
+        "_last_reset_date",
+        "_last_reset_date_iso",
+        "_history",
+    )
+
+    def __init__(self) -> None:
+        """Initialize the usage tracker."""
+        # Start of the running heating/cooling interval, as a monotonic reading
+        self._action_start: float | None = None
+        self._current_action: str | None = None
+        self._daily_heating_seconds: int = 0
+        self._daily_cooling_seconds: int = 0
+        self._last_reset_date: date = dt_util.now().date()
+        self._last_reset_date_iso: str = self._last_reset_date.isoformat()
+        self._history: dict[str, dict[str, float]] = {}
+
+    def update(self, hvac_action: str | None) -> None:
+        """Update tracking based on current HVAC action."""
+        now = monotonic()
+        today = dt_util.now().date()
+        
+        # Check if we need to reset daily counters
+        if today > self._last_reset_date:
+            self._save_daily_data()
+            self._reset_daily_counters(today)
+
+        # Running intervals only open or close when the action changes
+        if hvac_action == self._current_action:
+            return
+
+        # Close out the previous interval
+        if self._action_start is not None:
+            elapsed = int(now - self._action_start)
+            if self._current_action == HVACAction.HEATING:
+                self._daily_heating_seconds += elapsed
+            else:
+                self._daily_cooling_seconds += elapsed
+            self._action_start = None
+
+        # Open a new one if the system is now heating or cooling
+        self._current_action = hvac_action
+        if hvac_action in _TRACKED_ACTIONS:
+            self._action_start = now
+
+    def _save_daily_data(self) -> None:
+        """Save daily data to history."""
+        date_str = self._last_reset_date_iso
+        self._history[date_str] = {
+            "heating_hours": self._daily_heating_seconds / 3600,
+            "cooling_hours": self._daily_cooling_seconds / 3600,
+        }
+        
+        # Keep only last 90 days (history is inserted in date order)
+        if len(self._history) > 90:
+            oldest_date = next(iter(self._history))
+            del self._history[oldest_date]
+
+    def _reset_daily_counters(self, today: date) -> None:
+        """Reset daily counters."""
+        self._daily_heating_seconds = 0
+        self._daily_cooling_seconds = 0
+        self._last_reset_date = today
+        self._last_reset_date_iso = today.isoformat()
+
+    @property
+    def daily_heating_hours(self) -> float:
+        """Return daily heating hours."""
+        return self._daily_heating_seconds / 3600
+
+    @property
+    def daily_cooling_hours(self) -> float:
+        """Return daily cooling hours."""
+        return self._daily_cooling_seconds / 3600
+
+    def get_history(self, days: int = 30) -> dict[str, dict[str, float]]:
+        """Get historical data for the last N days."""
+        start_date = (dt_util.now().date() - timedelta(days=days)).isoformat()
+        return {
+            date: data
+            for date, data in self._history.items()
+            if date >= start_date
+        }
+
+    def export_csv(self) -> str:
+        """Export history as CSV."""
+        buf = io.StringIO()
+        buf.write("Date,Heating Hours,Cooling Hours")
+
+        # History is inserted in date order, so no sort is needed
+        for date_str, data in self._history.items():
+            buf.write(
+                f"\n{date_str},{data['heating_hours']:.2f},{data['cooling_hours']:.2f}"
+            )
+
+        # Add the current day's data (in progress)
+        buf.write(
+            f"\n{self._last_reset_date_iso},{self.daily_heating_hours:.2f},{self.daily_cooling_hours:.2f}"
+        )
+
+        return buf.getvalue()